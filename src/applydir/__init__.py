@@ -1,13 +1,30 @@
-from .applydir_applicator import ApplydirApplicator
-from .applydir_changes import ApplydirChanges
-from .applydir_distance import levenshtein_distance, levenshtein_similarity, sequence_matcher_similarity
-from .applydir_error import ApplydirError, ErrorType, ErrorSeverity
-from .applydir_file_change import ApplydirFileChange, get_non_ascii_severity
+import importlib
+
 from .applydir_format_description import applydir_format_description
-from .applydir_matcher import ApplydirMatcher
-from .applydir_result import ApplydirResult
+
+# main is bound eagerly: importing the applydir.main submodule sets the package attribute to the
+# module, so a lazily fetched function would be shadowed once anything imports applydir.main.
+# main.py defers its own heavy imports to call time, so this stays cheap.
 from .main import main
 
+# Everything else is imported on first attribute access (PEP 562).
+_LAZY_EXPORTS = {
+    "ApplydirApplicator": ".applydir_applicator",
+    "ApplydirChanges": ".applydir_changes",
+    "ApplydirError": ".applydir_error",
+    "ApplydirFileChange": ".applydir_file_change",
+    "ApplydirMatcher": ".applydir_matcher",
+    "ApplydirResult": ".applydir_result",
+    "ErrorSeverity": ".applydir_error",
+    "ErrorType": ".applydir_error",
+    "get_non_ascii_severity": ".applydir_file_change",
+    "levenshtein_distance": ".applydir_distance",
+    "levenshtein_similarity": ".applydir_distance",
+    "line_similarity": ".applydir_distance",
+    "rapidfuzz_similarity": ".applydir_distance",
+    "sequence_matcher_similarity": ".applydir_distance",
+}
+
 __all__ = [
     "applydir_format_description",
     "ApplydirApplicator",
@@ -21,9 +38,21 @@ __all__ = [
     "get_non_ascii_severity",
     "levenshtein_distance",
     "levenshtein_similarity",
+    "line_similarity",
     "main",
+    "rapidfuzz_similarity",
     "sequence_matcher_similarity",
 ]
 
-# Rebuild Pydantic models after all classes are defined
-ApplydirError.model_rebuild()
+
+def __getattr__(name):
+    module_name = _LAZY_EXPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module_name, __name__), name)
+    globals()[name] = value  # Cache so later lookups skip __getattr__
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
@@ -1,17 +1,121 @@
+import errno
+import functools
 import logging
-from .applydir_changes import ApplydirChanges
+import os
+import secrets
+import stat
+from .applydir_changes import ApplydirChanges, FileEntry
 from .applydir_error import ApplydirError, ErrorType, ErrorSeverity
 from .applydir_file_change import ApplydirFileChange, ActionType
 from .applydir_matcher import ApplydirMatcher
 from .applydir_result import ApplydirResult
-from dynaconf import Dynaconf
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from prepdir import load_config
-from typing import List, Optional, Dict
+from typing import List, Optional, Dict, Tuple
 
 logger = logging.getLogger("applydir")
 
 
+
+@functools.lru_cache(maxsize=1)
+def _default_config():
+    """Loads the applydir config once per process; each applicator still gets its own Dynaconf around it."""
+    from prepdir import load_config  # Deferred: only needed once an applicator is built
+
+    return load_config(namespace="applydir") or {
+        "validation": {"non_ascii": {"default": "warning", "rules": []}},
+        "allow_file_deletion": True,
+        "parallel_workers": 32,
+        "matching": {
+            "whitespace": {"default": "collapse"},
+            "similarity": {"default": 0.95},
+            "similarity_metric": {"default": "levenshtein"},  # Updated default to levenshtein
+            "use_fuzzy": {"default": True},
+        },
+    }
+
+
+def _read_lines(file_path: Path) -> List[str]:
+    """Reads file_path as a list of lines without line endings.
+
+    Splits on '\n' only (the text layer already folds '\r\n'), so form feeds and other characters
+    str.splitlines() treats as breaks stay inside their line. A trailing newline does not add an empty line.
+    """
+    with open(file_path, "r", encoding="utf-8") as f:
+        lines = f.read().split("\n")
+    if lines[-1] == "":
+        lines.pop()
+    return lines
+
+
+def _create_temp_file(directory: str, name: str) -> Tuple[int, str]:
+    """Exclusively creates a fresh temp file for name in directory; mode 0o666 is narrowed by the kernel's umask."""
+    flags = os.O_CREAT | os.O_EXCL | os.O_WRONLY | getattr(os, "O_BINARY", 0)
+    for _ in range(100):
+        tmp_name = os.path.join(directory, f".{name}.{secrets.token_hex(4)}.applydir.tmp")
+        try:
+            return os.open(tmp_name, flags, 0o666), tmp_name
+        except FileExistsError:
+            continue  # Name taken (leftover or concurrent writer); draw another
+    raise FileExistsError(errno.EEXIST, "No unused temporary file name", os.path.join(directory, name))
+
+
+def _write_in_place(target: str, payload: bytes) -> None:
+    """Overwrites target through its existing inode, keeping hard links, owner and mode intact."""
+    with open(target, "wb") as f:
+        f.write(payload)
+
+
+def _atomic_write(file_path: Path, payload: bytes) -> None:
+    """Writes payload to a temp file beside the file file_path resolves to, then renames it over that file.
+
+    Symlinks are followed, so the link survives and its target is updated. A file with several hard links,
+    or one whose owner or directory would not survive the rename, is rewritten in place instead.
+    """
+    target = os.path.realpath(file_path)
+    try:
+        st = os.stat(target)
+    except FileNotFoundError:
+        st = None
+    if st is not None and not os.access(target, os.W_OK):
+        raise PermissionError(errno.EACCES, os.strerror(errno.EACCES), str(file_path))
+    if st is not None and st.st_nlink > 1:
+        _write_in_place(target, payload)  # A rename would detach this name from the other links
+        return
+    # A unique name in the target directory keeps the rename atomic and safe for concurrent writers
+    try:
+        fd, tmp_name = _create_temp_file(os.path.dirname(target), os.path.basename(target))
+    except PermissionError:
+        if st is None:
+            raise
+        _write_in_place(target, payload)  # Writable file in a read-only directory
+        return
+    try:
+        with os.fdopen(fd, "wb") as f:
+            f.write(payload)
+        in_place = False
+        if st is not None:
+            os.chmod(tmp_name, stat.S_IMODE(st.st_mode))  # Keep the original permission bits
+            tmp_st = os.stat(tmp_name)
+            chown = getattr(os, "chown", None)
+            if chown is not None and (tmp_st.st_uid, tmp_st.st_gid) != (st.st_uid, st.st_gid):
+                try:
+                    chown(tmp_name, st.st_uid, st.st_gid)
+                except PermissionError:
+                    in_place = True  # Renaming would give the file to us; the existing inode keeps its owner
+        if in_place:
+            os.unlink(tmp_name)
+            _write_in_place(target, payload)
+        else:
+            os.replace(tmp_name, target)
+    except BaseException:
+        try:
+            os.unlink(tmp_name)
+        except FileNotFoundError:
+            pass
+        raise
+
+
 class ApplydirApplicator:
     """Applies validated changes to files."""
 
@@ -26,17 +130,9 @@ class ApplydirApplicator:
         self.base_dir = Path(base_dir)
         self.changes = changes
         self.logger = logger or logging.getLogger("applydir")
-        default_config = load_config(namespace="applydir") or {
-            "validation": {"non_ascii": {"default": "warning", "rules": []}},
-            "allow_file_deletion": True,
-            "matching": {
-                "whitespace": {"default": "collapse"},
-                "similarity": {"default": 0.95},
-                "similarity_metric": {"default": "levenshtein"},  # Updated default to levenshtein
-                "use_fuzzy": {"default": True},
-            },
-        }
-        self.config = Dynaconf(settings_files=[default_config], merge_enabled=True)
+        from dynaconf import Dynaconf  # Deferred so importing the module stays cheap
+
+        self.config = Dynaconf(settings_files=[_default_config()], merge_enabled=True)
         if config_override:
             self.config.update(config_override, merge=True)
         self.matcher = matcher or ApplydirMatcher(config=self.config)
@@ -48,96 +144,155 @@ class ApplydirApplicator:
         if not self.changes:
             return errors
         
-        for file_entry in self.changes.file_entries:
-            file_path = self.base_dir / file_entry.file
-            change_count = 0
-            actions = set()
-            file_errors = []
-
-            # Create ApplydirFileChange instances
-            changes = []
+        file_entries = self.changes.file_entries
+        # Snapshot the config once per run; as_dict() copies the whole Dynaconf tree
+        config = self.config.as_dict()
+        # Entries that resolve to the same file must run in order; distinct files run in parallel
+        groups: Dict[str, List[int]] = {}
+        for index, file_entry in enumerate(file_entries):
             try:
-                # To make sure we process entries without changes, set change_dict to a single None entry
-                change_dicts = [None] if not file_entry.changes else file_entry.changes
-                for change_dict in change_dicts:
-                    try:
-                        change = ApplydirFileChange.from_file_entry(file_path, file_entry.action, change_dict)
-                        changes.append(change)
-                    except ValueError as e:
-                        file_errors.append(
-                            ApplydirError(
-                                change=None,
-                                error_type=ErrorType.INVALID_CHANGE,
-                                severity=ErrorSeverity.ERROR,
-                                message=str(e),
-                                details={"file": file_entry.file},
-                            )
-                        )
-                    except Exception as e:
-                        file_errors.append(
-                            ApplydirError(
-                                change=None,
-                                error_type=ErrorType.INVALID_CHANGE,
-                                severity=ErrorSeverity.ERROR,
-                                message=f"Failed to create ApplydirFileChange: {str(e)}",
-                                details={"file": file_entry.file},
-                            )
-                        )
-            except Exception as e:
-                file_errors.append(
-                    ApplydirError(
-                        change=None,
-                        error_type=ErrorType.INVALID_CHANGE,
-                        severity=ErrorSeverity.ERROR,
-                        message=f"Unexpected error processing changes: {str(e)}",
-                        details={"file": file_entry.file},
-                    )
-                )
+                key = os.path.realpath(self.base_dir / file_entry.file)
+            except (OSError, ValueError):  # e.g. an embedded null byte; _apply_file_entry reports it for this entry
+                key = str(self.base_dir / file_entry.file)
+            groups.setdefault(key, []).append(index)
+
+        def apply_group(indices: List[int]) -> List[Tuple[int, List[ApplydirError]]]:
+            return [(index, self._apply_file_entry(file_entries[index], config)) for index in indices]
+
+        results: Dict[int, List[ApplydirError]] = {}
+        max_workers = min(self._parallel_workers(), len(groups))
+        if max_workers <= 1:
+            for indices in groups.values():
+                results.update(apply_group(indices))
+        else:
+            with ThreadPoolExecutor(max_workers=max_workers) as executor:
+                for group_results in executor.map(apply_group, groups.values()):
+                    results.update(group_results)
+        for index in range(len(file_entries)):
+            errors.extend(results[index])
+
+        return ApplydirResult(
+            errors=errors,
+            commit_message=self.changes.message,   # None if not supplied
+            success=not any(e.severity == ErrorSeverity.ERROR for e in errors),
+        )
 
-            # Validate and process changes
-            for change in changes:
-                validation_errors = change.validate_change(self.config.as_dict())
-                file_errors.extend(validation_errors)
-                if any(e.severity == ErrorSeverity.ERROR for e in validation_errors):
-                    continue
+    def _parallel_workers(self) -> int:
+        """Returns the configured number of worker threads for apply_changes (1 means serial)."""
+        workers = self.config.get("parallel_workers", 32)
+        if isinstance(workers, bool) or not isinstance(workers, int) or workers < 1:
+            self.logger.warning("Invalid parallel_workers '%s', using 32", workers)
+            return 32
+        return workers
+
+    def _apply_file_entry(self, file_entry: FileEntry, config: Dict) -> List[ApplydirError]:
+        """Applies the changes of a single file entry, ending with a file-level success entry if any applied."""
+        file_path = self.base_dir / file_entry.file
+        change_count = 0
+        actions = set()
+        file_errors = []
+
+        # Create ApplydirFileChange instances
+        changes = []
+        try:
+            # To make sure we process entries without changes, set change_dict to a single None entry
+            change_dicts = [None] if not file_entry.changes else file_entry.changes
+            for change_dict in change_dicts:
                 try:
-                    if change.action == ActionType.CREATE_FILE:
-                        file_errors.extend(self.create_file(file_path, change))
-                    elif change.action == ActionType.REPLACE_LINES:
-                        file_errors.extend(self.replace_lines(file_path, change))
-                    elif change.action == ActionType.DELETE_FILE:
-                        file_errors.extend(self.delete_file(file_path, change))
-                    if not any(e.severity == ErrorSeverity.ERROR for e in file_errors[-len(file_errors) :]):
-                        change_count += 1
-                        actions.add(change.action.value)
+                    change = ApplydirFileChange.from_file_entry(file_path, file_entry.action, change_dict)
+                    changes.append(change)
+                except ValueError as e:
+                    file_errors.append(
+                        ApplydirError(
+                            change=None,
+                            error_type=ErrorType.INVALID_CHANGE,
+                            severity=ErrorSeverity.ERROR,
+                            message=str(e),
+                            details={"file": file_entry.file},
+                        )
+                    )
                 except Exception as e:
                     file_errors.append(
                         ApplydirError(
-                            change=change,
-                            error_type=ErrorType.FILE_SYSTEM,
+                            change=None,
+                            error_type=ErrorType.INVALID_CHANGE,
                             severity=ErrorSeverity.ERROR,
-                            message=f"Failed to apply change: {str(e)}",
-                            details={"file": str(file_path)},
+                            message=f"Failed to create ApplydirFileChange: {str(e)}",
+                            details={"file": file_entry.file},
                         )
                     )
+        except Exception as e:
+            file_errors.append(
+                ApplydirError(
+                    change=None,
+                    error_type=ErrorType.INVALID_CHANGE,
+                    severity=ErrorSeverity.ERROR,
+                    message=f"Unexpected error processing changes: {str(e)}",
+                    details={"file": file_entry.file},
+                )
+            )
+
+        # replace_lines changes share one in-memory copy of the file, written once after the loop
+        pending: Dict = {}
+        handlers = {
+            ActionType.CREATE_FILE: self.create_file,
+            ActionType.REPLACE_LINES: functools.partial(self.replace_lines, pending=pending),
+            ActionType.DELETE_FILE: self.delete_file,
+        }
+
+        severity_cache: Dict = {}  # Non-ASCII actions resolved from config once for this entry's changes
+
+        # Validate and process changes
+        for change in changes:
+            validation_errors = change.validate_change(config, severity_cache)
+            file_errors.extend(validation_errors)
+            if any(e.severity == ErrorSeverity.ERROR for e in validation_errors):
+                continue
+            try:
+                handler = handlers.get(change.action)
+                if handler is not None:
+                    file_errors.extend(handler(file_path, change))
+                if not any(e.severity == ErrorSeverity.ERROR for e in file_errors[-len(file_errors) :]):
+                    change_count += 1
+                    actions.add(change.action.value)
+            except Exception as e:
+                file_errors.append(
+                    ApplydirError(
+                        change=change,
+                        error_type=ErrorType.FILE_SYSTEM,
+                        severity=ErrorSeverity.ERROR,
+                        message=f"Failed to apply change: {str(e)}",
+                        details={"file": str(file_path)},
+                    )
+                )
 
-            # Append file-level success if any changes were applied successfully
-            errors.extend(file_errors)
-            if change_count > 0:
-                errors.append(
+        if "change" in pending:
+            try:
+                self.write_changes(file_path, pending["lines"], None, create_parents=False)
+            except Exception as e:
+                file_errors.append(
                     ApplydirError(
-                        change=None,
-                        error_type=ErrorType.FILE_CHANGES_SUCCESSFUL,
-                        severity=ErrorSeverity.INFO,
-                        message="All changes to file applied successfully",
-                        details={"file": str(file_path), "actions": list(actions), "change_count": change_count},
+                        change=pending["change"],
+                        error_type=ErrorType.FILE_SYSTEM,
+                        severity=ErrorSeverity.ERROR,
+                        message=f"File operation failed: {str(e)}",
+                        details={"file": str(pending["change"].file_path)},
                     )
                 )
-        return ApplydirResult(
-            errors=errors,
-            commit_message=self.changes.message,   # None if not supplied
-            success=not any(e.severity == ErrorSeverity.ERROR for e in errors),
-        )
+                change_count = 0  # Nothing reached the disk
+
+        # Append file-level success if any changes were applied successfully
+        if change_count > 0:
+            file_errors.append(
+                ApplydirError(
+                    change=None,
+                    error_type=ErrorType.FILE_CHANGES_SUCCESSFUL,
+                    severity=ErrorSeverity.INFO,
+                    message="All changes to file applied successfully",
+                    details={"file": str(file_path), "actions": list(actions), "change_count": change_count},
+                )
+            )
+        return file_errors
 
     def create_file(self, file_path: Path, change: ApplydirFileChange) -> List[ApplydirError]:
         """Creates a new file with the specified changes."""
@@ -168,12 +323,28 @@ class ApplydirApplicator:
             )
         return errors
 
-    def replace_lines(self, file_path: Path, change: ApplydirFileChange) -> List[ApplydirError]:
-        """Replaces lines in an existing file."""
+    def replace_lines(
+        self, file_path: Path, change: ApplydirFileChange, pending: Optional[Dict] = None
+    ) -> List[ApplydirError]:
+        """Replaces lines in an existing file.
+
+        If a pending dict is given, the file is read into pending["lines"] once and replacements are spliced there
+        (recording the change in pending["change"]) instead of being written; the caller writes the lines once.
+        """
         errors = []
         try:
-            # File system existence check
-            if not file_path.exists():
+            # Open directly rather than stat first; a missing file surfaces as FileNotFoundError, and an
+            # unopenable name (embedded null byte) as ValueError, which Path.exists() also reported as missing
+            try:
+                if pending is not None and "lines" in pending:
+                    file_content = pending["lines"]
+                else:
+                    file_content = _read_lines(file_path)
+                    if pending is not None:
+                        pending["lines"] = file_content
+            except UnicodeDecodeError:
+                raise  # Undecodable content is reported as a file operation failure below, not as missing
+            except (FileNotFoundError, ValueError):
                 errors.append(
                     ApplydirError(
                         change=change,
@@ -184,12 +355,17 @@ class ApplydirApplicator:
                     )
                 )
                 return errors
-            with open(file_path, "r", encoding="utf-8") as f:
-                file_content = f.read().splitlines()
             match_result, match_errors = self.matcher.match(file_content, change)
             errors.extend(match_errors)
-            if match_result:
-                self.write_changes(file_path, change.changed_lines, match_result)
+            # Skip the rewrite when the replacement is identical to the matched lines
+            if match_result and file_content[match_result["start"] : match_result["end"]] != change.changed_lines:
+                if pending is not None:
+                    file_content[match_result["start"] : match_result["end"]] = change.changed_lines
+                    pending["change"] = change
+                    return errors
+                self.write_changes(
+                    file_path, change.changed_lines, match_result, file_content=file_content, create_parents=False
+                )
         except Exception as e:
             errors.append(
                 ApplydirError(
@@ -217,19 +393,18 @@ class ApplydirApplicator:
             )
             return errors
         try:
-            if not file_path.exists():
-                errors.append(
-                    ApplydirError(
-                        change=change,
-                        error_type=ErrorType.FILE_NOT_FOUND,
-                        severity=ErrorSeverity.ERROR,
-                        message="File does not exist for deletion",
-                        details={"file": str(change.file_path)},
-                    )
-                )
-                return errors
             file_path.unlink()
-            self.logger.info(f"Deleted file: {change.file_path}")
+            self.logger.info("Deleted file: %s", change.file_path)
+        except FileNotFoundError:
+            errors.append(
+                ApplydirError(
+                    change=change,
+                    error_type=ErrorType.FILE_NOT_FOUND,
+                    severity=ErrorSeverity.ERROR,
+                    message="File does not exist for deletion",
+                    details={"file": str(change.file_path)},
+                )
+            )
         except Exception as e:
             errors.append(
                 ApplydirError(
@@ -242,14 +417,25 @@ class ApplydirApplicator:
             )
         return errors
 
-    def write_changes(self, file_path: Path, changed_lines: List[str], range: Optional[Dict]):
-        """Writes changed lines to the file."""
-        file_path.parent.mkdir(parents=True, exist_ok=True)
+    def write_changes(
+        self,
+        file_path: Path,
+        changed_lines: List[str],
+        range: Optional[Dict],
+        file_content: Optional[List[str]] = None,
+        create_parents: bool = True,
+    ):
+        """Writes changed lines to the file. If file_content (the file's current lines) is given, it is
+        spliced in place instead of re-reading the file. Pass create_parents=False when the file is known to exist."""
+        if create_parents:
+            file_path.parent.mkdir(parents=True, exist_ok=True)
         if range:
-            with open(file_path, "r", encoding="utf-8") as f:
-                content = f.read().splitlines()
+            # Splice into a copy; file_content belongs to the caller
+            content = _read_lines(file_path) if file_content is None else list(file_content)
             content[range["start"] : range["end"]] = changed_lines
         else:
             content = changed_lines
-        with open(file_path, "w", encoding="utf-8") as f:
-            f.write("\n".join(content) + "\n")
+        text = "\n".join(content) + "\n"
+        if os.linesep != "\n":
+            text = text.replace("\n", os.linesep)  # The same bytes a text-mode write produces, e.g. CRLF on Windows
+        _atomic_write(file_path, text.encode("utf-8"))
@@ -1,15 +1,32 @@
-from typing import List, Optional, Dict
+from typing import Dict, Iterator, List, Optional, Tuple, Union
 from pydantic import BaseModel, field_validator, ValidationInfo, ConfigDict
 from .applydir_file_change import ApplydirFileChange, ActionType
 from .applydir_error import ApplydirError, ErrorType, ErrorSeverity
 from pathlib import Path
 import logging
 import json
+import os
 from pydantic_core import PydanticCustomError
 
 logger = logging.getLogger("applydir")
 
 
+def _resolve_under(base_str: str, rel: str) -> Tuple[str, bool]:
+    """Resolves rel against the absolute base_str; returns the resolved path and whether it stays inside base_str."""
+    # realpath on plain strings resolves symlinks like Path.resolve() without building Path objects
+    resolved = os.path.realpath(os.path.join(base_str, rel))
+    # The separator suffix stops a sibling like /base-other passing a /base prefix check
+    base_prefix = base_str if base_str.endswith(os.sep) else base_str + os.sep
+    return resolved, resolved == base_str or resolved.startswith(base_prefix)
+
+
+def _err(error_type: ErrorType, message: str, details: Dict) -> ApplydirError:
+    """Builds the change-less ERROR-severity ApplydirError used for structural and path problems."""
+    return ApplydirError(
+        change=None, error_type=error_type, severity=ErrorSeverity.ERROR, message=message, details=details
+    )
+
+
 class FileEntry(BaseModel):
     """Represents a single file entry with a file path, action, and list of changes."""
 
@@ -46,9 +63,14 @@ class ApplydirChanges(BaseModel):
     model_config = ConfigDict(extra="allow")  # Allow extra fields at top level
 
     def __init__(self, **data):
-        logger.debug(f"Raw input JSON for file_entries: {data.get('file_entries', [])}")
+        logger.debug("Raw input JSON for file_entries: %s", data.get("file_entries", []))
         super().__init__(**data)
 
+    @classmethod
+    def from_json(cls, raw: Union[str, bytes]) -> "ApplydirChanges":
+        """Parses and validates raw JSON in one pass inside pydantic-core, skipping the intermediate json.loads dicts."""
+        return cls.model_validate_json(raw)
+
     @field_validator("message")
     @classmethod
     def _check_message(cls, v: Optional[str]) -> Optional[str]:
@@ -69,52 +91,49 @@ class ApplydirChanges(BaseModel):
                 "empty_file_entries",
                 "JSON must contain a non-empty array of file entries",
                 dict(
-                    error=ApplydirError(
-                        change=None,
-                        error_type=ErrorType.JSON_STRUCTURE,
-                        severity=ErrorSeverity.ERROR,
-                        message="JSON must contain a non-empty array of file entries",
-                        details={},
-                    )
+                    error=_err(ErrorType.JSON_STRUCTURE, "JSON must contain a non-empty array of file entries", {})
                 ),
             )
         return v
 
-    def validate_changes(self, base_dir: str, config: Optional[Dict] = None) -> List[ApplydirError]:
-        """Validates all file changes for structure (via ApplydirFileChange) and path containment. No file system checks."""
+    def validate_changes(
+        self, base_dir: str, config: Optional[Dict] = None, early_exit: bool = False
+    ) -> List[ApplydirError]:
+        """Validates all file changes for structure (via ApplydirFileChange) and path containment. No file system checks.
+
+        With early_exit=True, validation stops at the first ERROR-severity item, for callers that only need
+        pass/fail; warnings found before it are still returned.
+        """
+        if not early_exit:
+            return list(self.iter_errors(base_dir, config))
         errors = []
+        for error in self.iter_errors(base_dir, config):
+            errors.append(error)
+            if error.severity == ErrorSeverity.ERROR:
+                break
+        return errors
+
+    def iter_errors(self, base_dir: str, config: Optional[Dict] = None) -> Iterator[ApplydirError]:
+        """Yields validation errors lazily, in validate_changes order, so callers can stop at the first one they care about."""
         if config is None:
             config = {}
 
-        logger.debug(f"Config used for validate_changes: {json.dumps(config, indent=4)}")
-        base_path = Path(base_dir).resolve()
+        if logger.isEnabledFor(logging.DEBUG):  # json.dumps runs eagerly, so skip it unless the record is emitted
+            logger.debug("Config used for validate_changes: %s", json.dumps(config, indent=4))
+        base_str = os.path.realpath(base_dir)
+        severity_cache: Dict = {}  # Non-ASCII actions resolved from config, shared by every change below
 
         for file_entry in self.file_entries:
             # Validate file path containment (safety check)
             try:
-                file_path = (base_path / file_entry.file).resolve()
-                if not str(file_path).startswith(str(base_path)):
-                    errors.append(
-                        ApplydirError(
-                            change=None,
-                            error_type=ErrorType.FILE_PATH,
-                            severity=ErrorSeverity.ERROR,
-                            message="File path is outside project directory",
-                            details={"file": file_entry.file},
-                        )
-                    )
+                file_str, inside_base = _resolve_under(base_str, file_entry.file)
+                if not inside_base:
+                    yield _err(ErrorType.FILE_PATH, "File path is outside project directory", {"file": file_entry.file})
                     continue
             except Exception as e:
-                errors.append(
-                    ApplydirError(
-                        change=None,
-                        error_type=ErrorType.FILE_PATH,
-                        severity=ErrorSeverity.ERROR,
-                        message=f"Invalid file path: {str(e)}",
-                        details={"file": file_entry.file},
-                    )
-                )
+                yield _err(ErrorType.FILE_PATH, f"Invalid file path: {str(e)}", {"file": file_entry.file})
                 continue
+            file_path = Path(file_str)  # Only entries that pass containment need a Path
 
             # Process changes (or lack thereof if no changes)
             change_dicts = file_entry.changes or [None]  # Treat empty changes as a single None entry
@@ -123,16 +142,10 @@ class ApplydirChanges(BaseModel):
                     change_obj = ApplydirFileChange.from_file_entry(
                         file_path=file_path, action=file_entry.action, change_dict=change
                     )
-                    errors.extend(change_obj.validate_change(config=config))
+                    change_errors = change_obj.validate_change(config=config, severity_cache=severity_cache)
                 except Exception as e:
-                    errors.append(
-                        ApplydirError(
-                            change=None,
-                            error_type=ErrorType.JSON_STRUCTURE,
-                            severity=ErrorSeverity.ERROR,
-                            message=f"Invalid change structure: {str(e)}",
-                            details={"file": file_entry.file},
-                        )
+                    yield _err(
+                        ErrorType.JSON_STRUCTURE, f"Invalid change structure: {str(e)}", {"file": file_entry.file}
                     )
-
-        return errors
\ No newline at end of file
+                    continue
+                yield from change_errors
@@ -1,38 +1,36 @@
 from typing import List
 from difflib import SequenceMatcher
+from rapidfuzz import fuzz
+from rapidfuzz.distance import Levenshtein
 import logging
 
 logger = logging.getLogger(__name__)
 
 
-# If this needs to get more complex, or we need it to be faster, consider using rapidfuzz (pdm install rapidfuzz)
 def levenshtein_distance(s1: str, s2: str) -> int:
-    """Computes the Levenshtein distance between two strings."""
-    if len(s1) < len(s2):
-        return levenshtein_distance(s2, s1)
-    if not s2:
-        return len(s1)
-    previous_row = range(len(s2) + 1)
-    for i, c1 in enumerate(s1):
-        current_row = [i + 1]
-        for j, c2 in enumerate(s2):
-            insertions = previous_row[j + 1] + 1
-            deletions = current_row[j] + 1
-            substitutions = previous_row[j] + (c1 != c2)
-            current_row.append(min(insertions, deletions, substitutions))
-        previous_row = current_row
-    return previous_row[-1]
-
-
-def levenshtein_similarity(a: List[str], b: List[str]) -> float:
-    """Calculate Levenshtein-based similarity for two lists of strings, joining with newlines."""
+    """Computes the Levenshtein distance between two strings (RapidFuzz's bit-parallel C++ implementation)."""
+    return Levenshtein.distance(s1, s2)
+
+
+def levenshtein_similarity(a: List[str], b: List[str], score_cutoff: float = 0.0) -> float:
+    """Calculate Levenshtein-based similarity for two lists of strings, joining with newlines.
+
+    Similarities below score_cutoff are reported as 0.0, which lets RapidFuzz stop as soon as the distance exceeds
+    the allowed maximum instead of finishing the full computation.
+    """
     if len(a) != len(b):
         return 0.0  # Early exit if line counts differ
     a_str = "\n".join(a)
     b_str = "\n".join(b)
-    total_distance = levenshtein_distance(a_str, b_str)
     max_length = max(len(a_str), len(b_str))
-    return 1.0 - total_distance / max_length if max_length > 0 else 1.0
+    if max_length == 0:
+        return 1.0
+    # The epsilon keeps float error from rounding an exactly-at-cutoff distance down and rejecting it
+    max_distance = max(0, int((1.0 - score_cutoff) * max_length + 1e-9))
+    total_distance = Levenshtein.distance(a_str, b_str, score_cutoff=max_distance)
+    if total_distance > max_distance:
+        return 0.0
+    return 1.0 - total_distance / max_length
 
 
 def sequence_matcher_similarity(a: List[str], b: List[str]) -> float:
@@ -44,5 +42,33 @@ def sequence_matcher_similarity(a: List[str], b: List[str]) -> float:
     sm = SequenceMatcher(None, a_str, b_str)
     blocks = list(sm.get_matching_blocks())
 
-    logger.debug(f"Matching blocks are {blocks}")
+    logger.debug("Matching blocks are %s", blocks)
     return sm.ratio()
+
+
+def rapidfuzz_similarity(a: List[str], b: List[str]) -> float:
+    """Calculate RapidFuzz ratio (normalized Indel similarity) for two lists of strings, joining with newlines."""
+    if len(a) != len(b):
+        return 0.0  # Early exit if line counts differ
+    a_str = "\n".join(a)
+    b_str = "\n".join(b)
+    if not a_str and not b_str:
+        return 1.0
+    return fuzz.ratio(a_str, b_str) / 100.0
+
+
+def line_similarity(a: List[str], b: List[str]) -> float:
+    """Calculate line-aligned Levenshtein similarity for two lists of strings.
+
+    Lines are compared pairwise by position: identical lines cost nothing and only differing lines pay for a
+    character-level distance, so the work is O(sum of line lengths squared) rather than O(total length squared).
+    """
+    if len(a) != len(b):
+        return 0.0  # Early exit if line counts differ
+    total_distance = 0
+    max_length = 0
+    for a_line, b_line in zip(a, b):
+        max_length += max(len(a_line), len(b_line))
+        if a_line != b_line:
+            total_distance += Levenshtein.distance(a_line, b_line)
+    return 1.0 - total_distance / max_length if max_length > 0 else 1.0
@@ -30,26 +30,30 @@ class ErrorType(str, Enum):
     INVALID_CHANGE = "invalid_change"
 
     def __str__(self):
-        return {
-            ErrorType.CHANGED_LINES_EMPTY: "Empty changed_lines for replace_lines or create_file",
-            ErrorType.CHANGES_EMPTY: "Empty changes array for replace_lines or create_file",
-            ErrorType.CONFIGURATION: "Invalid configuration",
-            ErrorType.FILE_ALREADY_EXISTS: "File already exists",
-            ErrorType.FILE_CHANGES_SUCCESSFUL: "All changes to file applied successfully",
-            ErrorType.FILE_NOT_FOUND: "File does not exist",
-            ErrorType.FILE_PATH: "Invalid file path",
-            ErrorType.FILE_SYSTEM: "File system operation failed",
-            ErrorType.INVALID_CHANGE: "Invalid change content for the specified action",
-            ErrorType.JSON_STRUCTURE: "Invalid JSON structure or action",
-            ErrorType.LINTING: "Linting failed on file (handled by vibedir)",
-            ErrorType.MULTIPLE_MATCHES: "Multiple matches found for original_lines",
-            ErrorType.NO_MATCH: "No matching lines found in file",
-            ErrorType.NON_ASCII_CHARS: "Non-ASCII characters detected",
-            ErrorType.ORIG_LINES_EMPTY: "Empty original_lines not allowed for replace_lines",
-            ErrorType.ORIG_LINES_NOT_EMPTY: "Non-empty original_lines not allowed for create_file",
-            ErrorType.PERMISSION_DENIED: "Permission denied",
-            ErrorType.SYNTAX: "Invalid syntax in changed_lines",
-        }[self]
+        return _ERROR_TYPE_STR[self]
+
+
+# Built once at import rather than on every str(ErrorType) call
+_ERROR_TYPE_STR: Dict[ErrorType, str] = {
+    ErrorType.CHANGED_LINES_EMPTY: "Empty changed_lines for replace_lines or create_file",
+    ErrorType.CHANGES_EMPTY: "Empty changes array for replace_lines or create_file",
+    ErrorType.CONFIGURATION: "Invalid configuration",
+    ErrorType.FILE_ALREADY_EXISTS: "File already exists",
+    ErrorType.FILE_CHANGES_SUCCESSFUL: "All changes to file applied successfully",
+    ErrorType.FILE_NOT_FOUND: "File does not exist",
+    ErrorType.FILE_PATH: "Invalid file path",
+    ErrorType.FILE_SYSTEM: "File system operation failed",
+    ErrorType.INVALID_CHANGE: "Invalid change content for the specified action",
+    ErrorType.JSON_STRUCTURE: "Invalid JSON structure or action",
+    ErrorType.LINTING: "Linting failed on file (handled by vibedir)",
+    ErrorType.MULTIPLE_MATCHES: "Multiple matches found for original_lines",
+    ErrorType.NO_MATCH: "No matching lines found in file",
+    ErrorType.NON_ASCII_CHARS: "Non-ASCII characters detected",
+    ErrorType.ORIG_LINES_EMPTY: "Empty original_lines not allowed for replace_lines",
+    ErrorType.ORIG_LINES_NOT_EMPTY: "Non-empty original_lines not allowed for create_file",
+    ErrorType.PERMISSION_DENIED: "Permission denied",
+    ErrorType.SYNTAX: "Invalid syntax in changed_lines",
+}
 
 
 class ApplydirError(BaseModel):
@@ -79,3 +83,15 @@ class ApplydirError(BaseModel):
     @classmethod
     def ensure_details_dict(cls, v: Optional[Dict]) -> Optional[Dict]:
         return v or {}
+
+
+def _rebuild_error_model() -> None:
+    """Resolves the ApplydirFileChange forward reference; called once that module has defined the class."""
+    from .applydir_file_change import ApplydirFileChange  # noqa: F401 - picked up by model_rebuild
+
+    ApplydirError.model_rebuild()
+
+
+# applydir_file_change imports this module and rebuilds ApplydirError when it finishes loading; importing it
+# here means `from applydir.applydir_error import ApplydirError` alone still yields a fully defined model.
+from . import applydir_file_change  # noqa: E402,F401
@@ -1,7 +1,7 @@
 from typing import List, Optional, Dict
 from pathlib import Path
 from pydantic import BaseModel, field_validator, ValidationInfo, ConfigDict, field_serializer
-from .applydir_error import ApplydirError, ErrorType, ErrorSeverity
+from .applydir_error import ApplydirError, ErrorType, ErrorSeverity, _rebuild_error_model
 from enum import Enum
 import logging
 import json
@@ -46,14 +46,19 @@ class ApplydirFileChange(BaseModel):
             raise ValueError("File path must be a valid Path object and non-empty (and not '.')")
         return v
 
-    def validate_change(self, config: Dict = None) -> List[ApplydirError]:
-        """Validates the change content.  Returns list of AppldirErrors found"""
+    def validate_change(self, config: Dict = None, severity_cache: Optional[Dict] = None) -> List[ApplydirError]:
+        """Validates the change content.  Returns list of AppldirErrors found
+
+        severity_cache, if given, memoizes the non-ASCII actions resolved from config; share one dict across
+        changes validated against the same config.
+        """
         errors = []
 
         if config is None:
             config = {}
 
-        logger.debug(f"{self} got config: " + json.dumps(config, indent=4))
+        if logger.isEnabledFor(logging.DEBUG):  # json.dumps runs eagerly, so skip it unless the record is emitted
+            logger.debug("%s got config: %s", self, json.dumps(config, indent=4))
 
         # Action-specific validation
         if self.action == ActionType.CREATE_FILE:
@@ -110,7 +115,7 @@ class ApplydirFileChange(BaseModel):
                     )
                 )
 
-        errors += self.check_for_non_ascii_chars(config)
+        errors += self.check_for_non_ascii_chars(config, severity_cache)
 
         return errors
 
@@ -119,7 +124,7 @@ class ApplydirFileChange(BaseModel):
     ) -> List[ApplydirError]:
         errors = []
         for i, line in enumerate(lines_to_check, 1):
-            if any(ord(char) > 127 for char in str(line)):
+            if not str(line).isascii():  # C-level scan instead of a per-char Python loop
                 errors.append(
                     ApplydirError(
                         change=self,
@@ -131,16 +136,20 @@ class ApplydirFileChange(BaseModel):
                 )
         return errors
 
-    def check_for_non_ascii_chars(self, config: Dict) -> List[ApplydirError]:
+    def check_for_non_ascii_chars(self, config: Dict, severity_cache: Optional[Dict] = None) -> List[ApplydirError]:
         """Check for non-ascii characters per config. Returns list of ApplydirErrors when config actions are warning, errror"""
         # Determine non-ASCII action based on file extension
 
         if config is None:
             config = {}
+        if severity_cache is None:
+            severity_cache = {}
 
         errors = []
 
-        non_ascii_severity_for_path = get_non_ascii_severity(config, "path")
+        if ("path",) not in severity_cache:
+            severity_cache[("path",)] = get_non_ascii_severity(config, "path")
+        non_ascii_severity_for_path = severity_cache[("path",)]
         if non_ascii_severity_for_path in [
             "error",
             "warning",
@@ -148,9 +157,12 @@ class ApplydirFileChange(BaseModel):
             # Check path for non-ascii characters
             errors += self.non_ascii_errors_from_lines("file_path", [self.file_path], non_ascii_severity_for_path)
 
-        non_ascii_severity_for_ext = get_non_ascii_severity(
-            config, "extensions", file_extension=self.file_path.suffix.lower()
-        )
+        file_extension = self.file_path.suffix.lower()
+        if ("extensions", file_extension) not in severity_cache:
+            severity_cache[("extensions", file_extension)] = get_non_ascii_severity(
+                config, "extensions", file_extension=file_extension
+            )
+        non_ascii_severity_for_ext = severity_cache[("extensions", file_extension)]
         if non_ascii_severity_for_ext in [
             "error",
             "warning",
@@ -178,7 +190,7 @@ class ApplydirFileChange(BaseModel):
 
             return cls(file_path=file_path, original_lines=original_lines, changed_lines=changed_lines, action=action)
         except Exception as e:
-            logger.error(f"Failed to create ApplydirFileChange: {str(e)}")
+            logger.error("Failed to create ApplydirFileChange: %s", e)
             raise
 
 
@@ -207,5 +219,8 @@ def get_non_ascii_severity(config: Dict, rule_name: str, file_extension: str = N
             non_ascii_severity = rule.get("action", non_ascii_severity).lower()
 
     rule_name_str = str(rule_name) + " " + str(file_extension) if file_extension else rule_name
-    logger.debug(f"Non-ASCII action for {rule_name_str}: {non_ascii_severity}")
+    logger.debug("Non-ASCII action for %s: %s", rule_name_str, non_ascii_severity)
     return non_ascii_severity
+
+
+_rebuild_error_model()  # ApplydirError.change refers to ApplydirFileChange, defined above
@@ -2,13 +2,26 @@ from difflib import SequenceMatcher
 from typing import List, Dict, Optional, Tuple
 from .applydir_error import ApplydirError, ErrorType, ErrorSeverity
 from .applydir_file_change import ApplydirFileChange, ActionType
-from .applydir_distance import levenshtein_similarity, sequence_matcher_similarity
+from .applydir_distance import (
+    levenshtein_similarity,
+    line_similarity,
+    rapidfuzz_similarity,
+    sequence_matcher_similarity,
+)
 import logging
+import os
 import re
-from pathlib import Path
 
 logger = logging.getLogger("applydir")
 
+_WHITESPACE_RE = re.compile(r"\s+")
+
+
+def _file_extension(file_path) -> str:
+    """Return the lower-cased extension of file_path, as Path.suffix would, without building a Path object."""
+    extension = os.path.splitext(os.fspath(file_path))[1]
+    return "" if extension == "." else extension.lower()  # Path("foo.").suffix is "", splitext gives "."
+
 
 def _to_lowercase_keys(obj: Dict) -> Dict:
     """Recursively convert all dictionary keys to lowercase."""
@@ -38,7 +51,7 @@ class ApplydirMatcher:
         default_handling = matching.get("whitespace", {}).get("default", "collapse")
         if not file_path:
             return default_handling
-        file_extension = Path(file_path).suffix.lower()
+        file_extension = _file_extension(file_path)
         rules = matching.get("whitespace", {}).get("rules", [])
         for rule in rules:
             if file_extension in rule.get("extensions", []):
@@ -53,26 +66,31 @@ class ApplydirMatcher:
         # Validate default_threshold is a number
         if not isinstance(default_threshold, (int, float)):
             logger.warning(
-                f"Invalid default similarity threshold '{default_threshold}', using {self.default_similarity_threshold}"
+                "Invalid default similarity threshold '%s', using %s",
+                default_threshold,
+                self.default_similarity_threshold,
             )
             default_threshold = self.default_similarity_threshold
 
         if not file_path:
             return default_threshold
-        file_extension = Path(file_path).suffix.lower()
+        file_extension = _file_extension(file_path)
         rules = matching.get("similarity", {}).get("rules", [])
         for rule in rules:
             if file_extension in rule.get("extensions", []):
                 threshold = rule.get("threshold", default_threshold)
                 if not isinstance(threshold, (int, float)):
                     logger.warning(
-                        f"Invalid similarity threshold '{threshold}' for extension {file_extension}, using {default_threshold}"
+                        "Invalid similarity threshold '%s' for extension %s, using %s",
+                        threshold,
+                        file_extension,
+                        default_threshold,
                     )
                     return default_threshold
-                logger.debug(f"Got {threshold=} for {file_extension=}")
+                logger.debug("Got threshold=%r for file_extension=%r", threshold, file_extension)
                 return threshold
 
-        logger.debug(f"No rule found for {file_extension=}, using {default_threshold=}")
+        logger.debug("No rule found for file_extension=%r, using default_threshold=%r", file_extension, default_threshold)
         return default_threshold
 
     def get_similarity_metric(self, file_path: str) -> str:
@@ -82,7 +100,7 @@ class ApplydirMatcher:
         sim_metric = matching.get("similarity_metric", {}).get("default", "levenshtein")
         if not file_path:
             return sim_metric
-        file_extension = Path(file_path).suffix.lower()
+        file_extension = _file_extension(file_path)
         rules = matching.get("similarity_metric", {}).get("rules", [])
         for rule in rules:
             if file_extension in rule.get("extensions", []):
@@ -95,7 +113,7 @@ class ApplydirMatcher:
         default_use_fuzzy = matching.get("use_fuzzy", {}).get("default", True)
         if not file_path:
             return default_use_fuzzy
-        file_extension = Path(file_path).suffix.lower()
+        file_extension = _file_extension(file_path)
         rules = matching.get("use_fuzzy", {}).get("rules", [])
         for rule in rules:
             if file_extension in rule.get("extensions", []):
@@ -108,38 +126,43 @@ class ApplydirMatcher:
 
         if whitespace_handling_type not in ["strict", "remove", "ignore", "collapse"]:
             logger.warning(
-                f"Unknown whitespace handling type '{whitespace_handling_type}' (expecting 'strict', 'remove', 'ignore', or 'collapse') - will use collapse"
+                "Unknown whitespace handling type '%s' (expecting 'strict', 'remove', 'ignore', or 'collapse') - will use collapse",
+                whitespace_handling_type,
             )
 
         if whitespace_handling_type == "strict":
             norm = line
         elif whitespace_handling_type in ["remove", "ignore"]:
-            norm = re.sub(r"\s+", "", line)
+            norm = _WHITESPACE_RE.sub("", line)
         else:  # Default to collapse
-            norm = re.sub(r"\s+", " ", line.strip())  # Note that collapse also strips leading/trailing whitespace
+            norm = _WHITESPACE_RE.sub(" ", line.strip())  # Note that collapse also strips leading/trailing whitespace
 
         # Handle case
         norm = norm if case_sensitive else norm.lower()
 
         # Return result
         logger.debug(
-            f"Normalized line: '{line}' -> '{norm}' ({whitespace_handling_type=}, case_sensitive={self.case_sensitive})"
+            "Normalized line: '%s' -> '%s' (whitespace_handling_type=%r, case_sensitive=%s)",
+            line,
+            norm,
+            whitespace_handling_type,
+            self.case_sensitive,
         )
         return str(norm)
 
     def match(self, file_content: List[str], change: ApplydirFileChange) -> Tuple[Optional[Dict], List[ApplydirError]]:
         """Matches original_lines in file_content, tries exact first, then fuzzy if configured."""
         errors = []
-        logger.debug(f"Matching for file: {change.file_path}, action: {change.action}")
-        logger.debug(f"Input file_content: {file_content}")
-        logger.debug(f"Input original_lines: {change.original_lines}")
+        logger.debug("Matching for file: %s, action: %s", change.file_path, change.action)
+        logger.debug("Input file_content: %s", file_content)
+        logger.debug("Input original_lines: %s", change.original_lines)
 
         if change.action == ActionType.CREATE_FILE:
-            logger.debug(f"Skipping match for create_file action: {change.file_path}")
+            logger.debug("Skipping match for create_file action: %s", change.file_path)
             return None, []
 
         if not file_content:
-            logger.debug(f"Empty file content for {change.file_path}")
+            logger.debug("Empty file content for %s", change.file_path)
             errors.append(
                 ApplydirError(
                     change=change,
@@ -152,7 +175,7 @@ class ApplydirMatcher:
             return None, errors
 
         if not change.original_lines:
-            logger.debug(f"Empty original_lines for {change.file_path}")
+            logger.debug("Empty original_lines for %s", change.file_path)
             errors.append(
                 ApplydirError(
                     change=change,
@@ -168,11 +191,11 @@ class ApplydirMatcher:
         n = len(file_content)
         m = len(change.original_lines)
         search_limit = max(0, n - m + 1) if self.max_search_lines is None else min(n - m + 1, self.max_search_lines)
-        logger.debug(f"Search limit: {search_limit}, file lines: {n}, original lines: {m}")
+        logger.debug("Search limit: %s, file lines: %s, original lines: %s", search_limit, n, m)
 
         whitespace_handling_type = self.get_whitespace_handling(change.file_path)
 
-        logger.debug(f"Whitespace handling for {change.file_path}: {whitespace_handling_type}")
+        logger.debug("Whitespace handling for %s: %s", change.file_path, whitespace_handling_type)
 
         normalized_original = [
             self.normalize_line(line, whitespace_handling_type, self.case_sensitive) for line in change.original_lines
@@ -180,48 +203,64 @@ class ApplydirMatcher:
         normalized_content = [
             self.normalize_line(line, whitespace_handling_type, self.case_sensitive) for line in file_content
         ]
-        logger.debug(f"Normalized original_lines: {normalized_original}")
-        logger.debug(f"Normalized file_content: {normalized_content}")
+        logger.debug("Normalized original_lines: %s", normalized_original)
+        logger.debug("Normalized file_content: %s", normalized_content)
 
         # Exact matching first
-        logger.debug(f"Attempting exact match for {change.file_path}")
+        logger.debug("Attempting exact match for %s", change.file_path)
+        first_original = normalized_original[0]
         for i in range(search_limit):
+            # Only build a window when its first line lines up; most lines fail this single compare
+            if normalized_content[i] != first_original:
+                continue
             window = normalized_content[i : i + m]
-            logger.debug(f"Checking exact window at index {i}: {window} (size: {len(window)})")
+            logger.debug("Checking exact window at index %s: %s (size: %s)", i, window, len(window))
             if len(window) == m and window == normalized_original:
                 matches.append({"start": i, "end": i + m})
-                logger.debug(f"Exact match found at index {i} for {change.file_path}")
+                logger.debug("Exact match found at index %s for %s", i, change.file_path)
 
         # Fuzzy matching if no exact match and use_fuzzy is True
         use_fuzzy = self.get_use_fuzzy(change.file_path)
-        logger.debug(f"Use fuzzy matching for {change.file_path}: {use_fuzzy}")
+        logger.debug("Use fuzzy matching for %s: %s", change.file_path, use_fuzzy)
         if not matches and use_fuzzy:
             similarity_threshold = self.get_similarity_threshold(change.file_path)
             similarity_metric = self.get_similarity_metric(change.file_path)
             logger.debug(
-                f"Trying fuzzy match for {change.file_path}, metric: {similarity_metric}, threshold: {similarity_threshold}"
+                "Trying fuzzy match for %s, metric: %s, threshold: %s",
+                change.file_path,
+                similarity_metric,
+                similarity_threshold,
             )
             for i in range(search_limit):
                 window = normalized_content[i : i + m]
-                logger.debug(f"Checking fuzzy window at index {i}: {window} (size: {len(window)})")
+                logger.debug("Checking fuzzy window at index %s: %s (size: %s)", i, window, len(window))
                 if len(window) == m:
                     if similarity_metric == "sequence_matcher":
                         ratio = sequence_matcher_similarity(window, normalized_original)
-
+                    elif similarity_metric == "rapidfuzz_ratio":
+                        ratio = rapidfuzz_similarity(window, normalized_original)
+                    elif similarity_metric == "line_levenshtein":
+                        ratio = line_similarity(window, normalized_original)
                     else:
                         if similarity_metric is not None and similarity_metric != "levenshtein":
-                            logger.warning(f"Unrecognized similarity_metric {similarity_metric} - using levenshtein")
-                        ratio = levenshtein_similarity(window, normalized_original)
+                            logger.warning("Unrecognized similarity_metric %s - using levenshtein", similarity_metric)
+                        ratio = levenshtein_similarity(window, normalized_original, score_cutoff=similarity_threshold)
 
                     logger.debug(
-                        f"Fuzzy match attempt at index {i} for {change.file_path}, metric: {similarity_metric}, ratio: {ratio:.4f}, window: {window}, original: {normalized_original}"
+                        "Fuzzy match attempt at index %s for %s, metric: %s, ratio: %.4f, window: %s, original: %s",
+                        i,
+                        change.file_path,
+                        similarity_metric,
+                        ratio,
+                        window,
+                        normalized_original,
                     )
                     if ratio >= similarity_threshold:
                         matches.append({"start": i, "end": i + m})
-                        logger.debug(f"Fuzzy match found at index {i}, metric: {similarity_metric}, ratio: {ratio:.4f}")
+                        logger.debug("Fuzzy match found at index %s, metric: %s, ratio: %.4f", i, similarity_metric, ratio)
 
         if not matches:
-            logger.debug(f"No matches found for {change.file_path}")
+            logger.debug("No matches found for %s", change.file_path)
             errors.append(
                 ApplydirError(
                     change=change,
@@ -234,7 +273,7 @@ class ApplydirMatcher:
             return None, errors
 
         if len(matches) > 1:
-            logger.debug(f"Multiple matches found for {change.file_path}: {len(matches)} matches")
+            logger.debug("Multiple matches found for %s: %s matches", change.file_path, len(matches))
             errors.append(
                 ApplydirError(
                     change=change,
@@ -250,5 +289,5 @@ class ApplydirMatcher:
             )
             return None, errors
 
-        logger.debug(f"Single match found for {change.file_path} at start: {matches[0]['start']}")
+        logger.debug("Single match found for %s at start: %s", change.file_path, matches[0]["start"])
         return matches[0], []
@@ -1,15 +1,17 @@
 import argparse
-import json
 import logging
 from pathlib import Path
-from prepdir import configure_logging
-from .applydir_changes import ApplydirChanges
-from .applydir_matcher import ApplydirMatcher
-from .applydir_applicator import ApplydirApplicator
-from .applydir_error import ApplydirError, ErrorSeverity
 
 
 def main():
+    # Imported here so that `import applydir` (whose __init__ binds main) stays free of pydantic, prepdir and dynaconf
+    from prepdir import configure_logging
+    from pydantic import ValidationError
+    from .applydir_changes import ApplydirChanges
+    from .applydir_matcher import ApplydirMatcher
+    from .applydir_applicator import ApplydirApplicator
+    from .applydir_error import ErrorSeverity
+
     parser = argparse.ArgumentParser(description="Applydir: Apply LLM-generated changes to a codebase.")
     parser.add_argument("input_file", type=str, help="Path to JSON file containing changes")
     parser.add_argument(
@@ -37,18 +39,25 @@ def main():
         config_override["validation"] = {"non_ascii": {"default": args.non_ascii_action}}
 
     try:
-        with open(args.input_file, "r") as f:
-            changes_json = json.load(f)
+        with open(args.input_file, "rb") as f:
+            raw_changes = f.read()
     except Exception as e:
-        logger.error(f"Failed to read input file: {str(e)}")
+        logger.error("Failed to read input file: %s", e)
         return 1
 
     try:
         
         try:
-            changes = ApplydirChanges.model_validate(changes_json)
+            # Parse and validate in one pass; malformed JSON is still reported as an unreadable input file
+            changes = ApplydirChanges.from_json(raw_changes)
+        except ValidationError as e:
+            if any(err["type"] == "json_invalid" for err in e.errors()):
+                logger.error("Failed to read input file: %s", e)
+            else:
+                logger.error("Invalid JSON structure: %s", e)
+            return 1
         except Exception as e:
-            logger.error(f"Invalid JSON structure: {e}")
+            logger.error("Invalid JSON structure: %s", e)
             return 1
         
         matcher = ApplydirMatcher(similarity_threshold=0.95)
@@ -61,7 +70,9 @@ def main():
             for error in errors:
                 logger.log(
                     logging.WARNING if error.severity == "warning" else logging.ERROR,
-                    f"{error.message}: {error.details}",
+                    "%s: %s",
+                    error.message,
+                    error.details,
                 )
             return 1
 
@@ -76,7 +87,7 @@ def main():
                 if error.severity == ErrorSeverity.WARNING
                 else logging.ERROR
             )
-            logger.log(log_level, f"{error.message}: {error.details}")
+            logger.log(log_level, "%s: %s", error.message, error.details)
             if error.severity == ErrorSeverity.ERROR:
                 has_errors = True
         if has_errors:
@@ -84,10 +95,10 @@ def main():
 
         logger.info("Changes applied successfully")
         if result.commit_message:
-            logger.info(f"Commit message available: {result.commit_message!r}")
+            logger.info("Commit message available: %r", result.commit_message)
         return 0
     except Exception as e:
-        logger.error(f"Application failed: {str(e)}")
+        logger.error("Application failed: %s", e)
         return 1
 
 
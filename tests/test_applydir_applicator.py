@@ -1,5 +1,6 @@
 import pytest
 from pathlib import Path
+import applydir.applydir_applicator as applicator_module
 from applydir.applydir_applicator import ApplydirApplicator
 from applydir.applydir_file_change import ApplydirFileChange, ActionType
 from applydir.applydir_error import ApplydirError, ErrorType, ErrorSeverity
@@ -7,6 +8,9 @@ from applydir.applydir_matcher import ApplydirMatcher
 from applydir.applydir_changes import ApplydirChanges, FileEntry
 import logging
 import json
+import os
+import subprocess
+import sys
 from prepdir import configure_logging
 from pydantic import ValidationError
 
@@ -601,3 +605,284 @@ def test_replace_lines_fuzzy_sequence_matcher(tmp_path, applicator):
     assert errors[0].message == "No matching lines found"
     assert file_path.read_text() == "Print('Helo') \nx = 1\n"  # File unchanged
     logger.debug(f"SequenceMatcher fuzzy match failed as expected: {file_path.read_text()}")
+
+
+def test_replace_lines_identical_skips_write(tmp_path, applicator):
+    """Test a replacement identical to the matched lines leaves the file untouched."""
+    file_path = tmp_path / "main.py"
+    file_path.write_text("print('Hello')\nx = 1")  # No trailing newline; a rewrite would add one
+    changes = ApplydirChanges(
+        file_entries=[
+            FileEntry(
+                file="main.py",
+                action=ActionType.REPLACE_LINES,
+                changes=[{"original_lines": ["x = 1"], "changed_lines": ["x = 1"]}],
+            )
+        ]
+    )
+    applicator.changes = changes
+    result = applicator.apply_changes()
+    errors = result.errors
+    assert len(errors) == 1
+    assert errors[0].error_type == ErrorType.FILE_CHANGES_SUCCESSFUL
+    assert file_path.read_text() == "print('Hello')\nx = 1"
+
+
+def test_write_changes_atomic_keeps_mode(tmp_path, applicator):
+    """Test write_changes replaces the file in place, keeps its mode, and leaves no temp file."""
+    file_path = tmp_path / "script.sh"
+    file_path.write_text("echo old\n")
+    file_path.chmod(0o755)
+    applicator.write_changes(file_path, ["echo new"], {"start": 0, "end": 1})
+    assert file_path.read_text() == "echo new\n"
+    assert file_path.stat().st_mode & 0o777 == 0o755
+    assert [p.name for p in tmp_path.iterdir()] == ["script.sh"]
+
+
+def test_apply_changes_through_symlink_updates_target(tmp_path, applicator):
+    """Test changing a symlinked file rewrites the link's target and leaves the link in place."""
+    real_path = tmp_path / "real.py"
+    real_path.write_text("print('Hello')\nx = 1\n")
+    link_path = tmp_path / "link.py"
+    link_path.symlink_to(real_path)
+    applicator.changes = ApplydirChanges(
+        file_entries=[
+            FileEntry(
+                file="link.py",
+                action=ActionType.REPLACE_LINES,
+                changes=[{"original_lines": ["print('Hello')"], "changed_lines": ["print('Hello World')"]}],
+            )
+        ]
+    )
+    result = applicator.apply_changes()
+    assert result.success
+    assert link_path.is_symlink()
+    assert real_path.read_text() == "print('Hello World')\nx = 1\n"
+    assert sorted(p.name for p in tmp_path.iterdir()) == ["link.py", "real.py"]
+
+
+def test_write_changes_keeps_hard_links(tmp_path, applicator):
+    """Test a hard-linked file is rewritten in place so every link sees the change."""
+    file_path = tmp_path / "main.py"
+    file_path.write_text("old\n")
+    other_path = tmp_path / "copy.py"
+    os.link(file_path, other_path)
+    applicator.write_changes(file_path, ["new"], {"start": 0, "end": 1})
+    assert file_path.read_text() == "new\n"
+    assert other_path.read_text() == "new\n"
+    assert file_path.stat().st_ino == other_path.stat().st_ino
+
+
+def test_write_changes_uses_platform_line_separator(tmp_path, applicator, monkeypatch):
+    """Test written files end lines with os.linesep, as a text-mode write would."""
+    monkeypatch.setattr(os, "linesep", "\r\n")
+    file_path = tmp_path / "main.py"
+    applicator.write_changes(file_path, ["a", "b"], None)
+    assert file_path.read_bytes() == b"a\r\nb\r\n"
+
+
+def test_write_changes_uses_passed_file_content(tmp_path, applicator):
+    """Test write_changes splices a copy of the supplied file_content rather than re-reading the file."""
+    file_path = tmp_path / "main.py"
+    file_path.write_text("on disk\n")
+    file_content = ["a", "b", "c"]
+    applicator.write_changes(file_path, ["b2"], {"start": 1, "end": 2}, file_content=file_content)
+    assert file_path.read_text() == "a\nb2\nc\n"
+    assert file_content == ["a", "b", "c"]  # The caller's list is left untouched
+
+
+def test_apply_entries_for_same_file_in_order(tmp_path, applicator):
+    """Test entries targeting the same file are applied in order alongside other files."""
+    file_path = tmp_path / "new.py"
+    other_path = tmp_path / "other.py"
+    other_path.write_text("y = 1\n")
+    changes = ApplydirChanges(
+        file_entries=[
+            FileEntry(
+                file="new.py",
+                action=ActionType.CREATE_FILE,
+                changes=[{"original_lines": [], "changed_lines": ["x = 1", "z = 3"]}],
+            ),
+            FileEntry(
+                file="other.py",
+                action=ActionType.REPLACE_LINES,
+                changes=[{"original_lines": ["y = 1"], "changed_lines": ["y = 2"]}],
+            ),
+            FileEntry(
+                file="./new.py",
+                action=ActionType.REPLACE_LINES,
+                changes=[{"original_lines": ["x = 1"], "changed_lines": ["x = 2"]}],
+            ),
+        ]
+    )
+    applicator.changes = changes
+    result = applicator.apply_changes()
+    errors = result.errors
+    assert result.success
+    assert [e.details["actions"] for e in errors] == [["create_file"], ["replace_lines"], ["replace_lines"]]
+    assert file_path.read_text() == "x = 2\nz = 3\n"
+    assert other_path.read_text() == "y = 2\n"
+
+
+def test_config_override_does_not_leak_between_applicators(tmp_path):
+    """Test applicators share the loaded default config but keep overrides to themselves."""
+    first = ApplydirApplicator(base_dir=str(tmp_path), config_override={"allow_file_deletion": False})
+    second = ApplydirApplicator(base_dir=str(tmp_path))
+    assert first.config.get("allow_file_deletion") is False
+    assert second.config.get("allow_file_deletion", True) is True
+
+
+def test_write_changes_new_file_default_mode(tmp_path, applicator):
+    """Test a newly created file gets the mode the process umask gives any new file."""
+    old_umask = os.umask(0o027)
+    try:
+        file_path = tmp_path / "pkg" / "new.py"
+        applicator.write_changes(file_path, ["x = 1"], None)
+    finally:
+        os.umask(old_umask)
+    assert file_path.read_text() == "x = 1\n"
+    assert file_path.stat().st_mode & 0o777 == 0o640
+    assert [p.name for p in file_path.parent.iterdir()] == ["new.py"]
+
+
+def test_replace_lines_keeps_form_feed_in_line(tmp_path, applicator):
+    """Test a form feed inside a line is not treated as a line break when the file is rewritten."""
+    file_path = tmp_path / "main.py"
+    file_path.write_text("x = 1\n\x0c# section\ny = 2\n")
+    changes = ApplydirChanges(
+        file_entries=[
+            FileEntry(
+                file="main.py",
+                action=ActionType.REPLACE_LINES,
+                changes=[{"original_lines": ["y = 2"], "changed_lines": ["y = 3"]}],
+            )
+        ]
+    )
+    applicator.changes = changes
+    errors = applicator.apply_changes().errors
+    assert len(errors) == 1
+    assert errors[0].error_type == ErrorType.FILE_CHANGES_SUCCESSFUL
+    assert file_path.read_text() == "x = 1\n\x0c# section\ny = 3\n"
+
+
+def test_parallel_workers_one_applies_serially(tmp_path, monkeypatch):
+    """Test parallel_workers=1 applies entries without starting a thread pool."""
+    def no_pool(*args, **kwargs):
+        raise AssertionError("thread pool should not be used")
+
+    monkeypatch.setattr(applicator_module, "ThreadPoolExecutor", no_pool)
+    (tmp_path / "a.py").write_text("a = 1\n")
+    (tmp_path / "b.py").write_text("b = 1\n")
+    applicator = ApplydirApplicator(base_dir=str(tmp_path), config_override={"parallel_workers": 1}, logger=logger)
+    applicator.changes = ApplydirChanges(
+        file_entries=[
+            FileEntry(
+                file=name,
+                action=ActionType.REPLACE_LINES,
+                changes=[{"original_lines": [f"{name[0]} = 1"], "changed_lines": [f"{name[0]} = 2"]}],
+            )
+            for name in ("a.py", "b.py")
+        ]
+    )
+    result = applicator.apply_changes()
+    assert result.success
+    assert (tmp_path / "a.py").read_text() == "a = 2\n"
+    assert (tmp_path / "b.py").read_text() == "b = 2\n"
+
+
+def test_replace_lines_file_not_found(tmp_path, applicator):
+    """Test replace_lines on a missing file reports FILE_NOT_FOUND."""
+    change = ApplydirFileChange(
+        file_path="missing.py",
+        original_lines=["x = 1"],
+        changed_lines=["x = 2"],
+        action=ActionType.REPLACE_LINES,
+    )
+    errors = applicator.replace_lines(tmp_path / "missing.py", change)
+    assert len(errors) == 1
+    assert errors[0].error_type == ErrorType.FILE_NOT_FOUND
+    assert errors[0].message == "File does not exist for modification"
+    assert not (tmp_path / "missing.py").exists()
+
+
+def test_multiple_changes_single_file_written_once(tmp_path, applicator, monkeypatch):
+    """Test several replace_lines changes to one file are read and written once."""
+    calls = {"read": 0, "write": 0}
+    read_lines, atomic_write = applicator_module._read_lines, applicator_module._atomic_write
+
+    def counting_read(*args):
+        calls["read"] += 1
+        return read_lines(*args)
+
+    def counting_write(*args):
+        calls["write"] += 1
+        return atomic_write(*args)
+
+    monkeypatch.setattr(applicator_module, "_read_lines", counting_read)
+    monkeypatch.setattr(applicator_module, "_atomic_write", counting_write)
+    file_path = tmp_path / "main.py"
+    file_path.write_text("a = 1\nb = 1\nc = 1\n")
+    applicator.changes = ApplydirChanges(
+        file_entries=[
+            FileEntry(
+                file="main.py",
+                action=ActionType.REPLACE_LINES,
+                changes=[
+                    {"original_lines": ["a = 1"], "changed_lines": ["a = 2"]},
+                    {"original_lines": ["c = 1"], "changed_lines": ["c = 2", "d = 2"]},
+                    {"original_lines": ["d = 2"], "changed_lines": ["d = 3"]},
+                ],
+            )
+        ]
+    )
+    result = applicator.apply_changes()
+    assert result.success
+    assert result.errors[0].details["change_count"] == 3
+    assert file_path.read_text() == "a = 2\nb = 1\nc = 2\nd = 3\n"
+    assert calls == {"read": 1, "write": 1}
+
+
+def test_create_temp_file_retries_on_collision(tmp_path, monkeypatch):
+    """Test _create_temp_file draws a new name when the first one is already taken."""
+    tokens = iter(["taken", "free"])
+    monkeypatch.setattr(applicator_module.secrets, "token_hex", lambda n: next(tokens))
+    (tmp_path / ".main.py.taken.applydir.tmp").write_text("someone else's\n")
+    fd, tmp_name = applicator_module._create_temp_file(str(tmp_path), "main.py")
+    os.close(fd)
+    assert tmp_name == str(tmp_path / ".main.py.free.applydir.tmp")
+    assert (tmp_path / ".main.py.taken.applydir.tmp").read_text() == "someone else's\n"
+
+
+def test_import_applicator_defers_config_loading_dependencies():
+    """Test importing the applicator module does not load prepdir or dynaconf until an applicator is built."""
+    script = (
+        "import sys\n"
+        "import applydir.applydir_applicator\n"
+        "loaded = [name for name in ('prepdir', 'dynaconf') if name in sys.modules]\n"
+        "assert not loaded, loaded\n"
+    )
+    completed = subprocess.run([sys.executable, "-c", script], capture_output=True, text=True)
+    assert completed.returncode == 0, completed.stderr
+
+
+def test_apply_changes_bad_path_is_per_entry_error(tmp_path, applicator):
+    """Test a path that cannot be resolved fails only its own entry instead of aborting the run."""
+    file_path = tmp_path / "main.py"
+    file_path.write_text("print('Hello')\n")
+    applicator.changes = ApplydirChanges(
+        file_entries=[
+            FileEntry(
+                file="bad\x00.py",
+                action=ActionType.REPLACE_LINES,
+                changes=[{"original_lines": ["x = 1"], "changed_lines": ["x = 2"]}],
+            ),
+            FileEntry(
+                file="main.py",
+                action=ActionType.REPLACE_LINES,
+                changes=[{"original_lines": ["print('Hello')"], "changed_lines": ["print('Hello World')"]}],
+            ),
+        ]
+    )
+    result = applicator.apply_changes()
+    assert [e.error_type for e in result.errors] == [ErrorType.FILE_NOT_FOUND, ErrorType.FILE_CHANGES_SUCCESSFUL]
+    assert file_path.read_text() == "print('Hello World')\n"
@@ -286,3 +286,86 @@ def test_multiple_errors():
     assert any("Empty original_lines not allowed for replace_lines" in msg for msg in error_messages)
     assert any("Non-empty original_lines not allowed for create_file" in msg for msg in error_messages)
     assert any("Non-ASCII characters found in changed_lines" in msg for msg in error_messages)
+
+
+def test_iter_errors_is_lazy():
+    """Test iter_errors yields the same errors as validate_changes, one at a time."""
+    changes_json = [
+        {"file": "../outside.py", "action": "create_file", "changes": [{"changed_lines": ["x = 1"]}]},
+        {"file": "src/main.py", "action": "create_file", "changes": [{"changed_lines": ["print('Hello 😊')"]}]},
+    ]
+    changes = ApplydirChanges(file_entries=changes_json)
+    config = {"validation": {"non_ascii": {"default": "error"}}}
+    error_iter = changes.iter_errors(base_dir=str(Path.cwd()), config=config)
+    first = next(error_iter)
+    assert first.error_type == ErrorType.FILE_PATH
+    assert [e.error_type for e in error_iter] == [ErrorType.NON_ASCII_CHARS]
+    assert [e.error_type for e in changes.validate_changes(base_dir=str(Path.cwd()), config=config)] == [
+        ErrorType.FILE_PATH,
+        ErrorType.NON_ASCII_CHARS,
+    ]
+
+
+def test_from_json():
+    """Test from_json parses raw JSON the same way as constructing from a dict."""
+    raw = json.dumps(
+        {
+            "message": "Update greeting",
+            "file_entries": [
+                {
+                    "file": "src/main.py",
+                    "action": "replace_lines",
+                    "changes": [{"original_lines": ["print('Hello')"], "changed_lines": ["print('Hello World')"]}],
+                }
+            ],
+        }
+    )
+    changes = ApplydirChanges.from_json(raw.encode("utf-8"))
+    assert changes == ApplydirChanges(**json.loads(raw))
+    assert changes.message == "Update greeting"
+    assert changes.file_entries[0].action == ActionType.REPLACE_LINES
+    with pytest.raises(ValidationError):
+        ApplydirChanges.from_json('{"file_entries": []}')
+
+
+def test_path_in_sibling_dir_with_base_prefix(tmp_path):
+    """Test a sibling directory sharing base_dir's name as a prefix is treated as outside."""
+    base_dir = tmp_path / "project"
+    base_dir.mkdir()
+    changes_json = [
+        {"file": "../project-other/main.py", "action": "create_file", "changes": [{"changed_lines": ["x = 1"]}]}
+    ]
+    changes = ApplydirChanges(file_entries=changes_json)
+    errors = changes.validate_changes(base_dir=str(base_dir))
+    assert len(errors) == 1
+    assert errors[0].error_type == ErrorType.FILE_PATH
+    assert errors[0].message == "File path is outside project directory"
+
+
+def test_validate_changes_early_exit():
+    """Test early_exit stops at the first error-severity item."""
+    changes_json = [
+        {"file": "../outside.py", "action": "create_file", "changes": [{"changed_lines": ["x = 1"]}]},
+        {"file": "../other.py", "action": "create_file", "changes": [{"changed_lines": ["y = 1"]}]},
+    ]
+    changes = ApplydirChanges(file_entries=changes_json)
+    assert len(changes.validate_changes(base_dir=str(Path.cwd()))) == 2
+    errors = changes.validate_changes(base_dir=str(Path.cwd()), early_exit=True)
+    assert len(errors) == 1
+    assert errors[0].details == {"file": "../outside.py"}
+
+    # A warning does not end validation early; it is kept along with the first error after it
+    changes = ApplydirChanges(
+        file_entries=[
+            {"file": "a.md", "action": "create_file", "changes": [{"changed_lines": ["café"]}]},
+            {"file": "../outside.py", "action": "create_file", "changes": [{"changed_lines": ["x = 1"]}]},
+            {"file": "../other.py", "action": "create_file", "changes": [{"changed_lines": ["y = 1"]}]},
+        ]
+    )
+    config = {"validation": {"non_ascii": {"default": "warning"}}}
+    errors = changes.validate_changes(base_dir=str(Path.cwd()), config=config, early_exit=True)
+    assert [(e.error_type, e.severity) for e in errors] == [
+        (ErrorType.NON_ASCII_CHARS, ErrorSeverity.WARNING),
+        (ErrorType.FILE_PATH, ErrorSeverity.ERROR),
+    ]
+    assert errors[1].details == {"file": "../outside.py"}
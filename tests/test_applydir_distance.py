@@ -1,5 +1,11 @@
 import pytest
-from applydir.applydir_distance import levenshtein_distance, levenshtein_similarity, sequence_matcher_similarity
+from applydir.applydir_distance import (
+    levenshtein_distance,
+    levenshtein_similarity,
+    line_similarity,
+    rapidfuzz_similarity,
+    sequence_matcher_similarity,
+)
 
 
 def test_levenshtein_distance():
@@ -35,3 +41,32 @@ def test_sequence_matcher_similarity():
     assert sequence_matcher_similarity(["line1\nline2"], ["line1\nline3"]) == pytest.approx(
         0.909, abs=0.001
     )  # SequenceMatcher ratio: 2*10/22
+
+
+def test_rapidfuzz_similarity():
+    assert rapidfuzz_similarity(["hello"], ["hello"]) == 1.0
+    assert rapidfuzz_similarity(["kitten"], ["sitting"]) == pytest.approx(
+        0.615, abs=0.001
+    )  # Indel ratio: 1 - 5/13
+    assert rapidfuzz_similarity(["line1", "line2"], ["line1", "line3"]) == pytest.approx(
+        0.909, abs=0.001
+    )  # Indel ratio: 1 - 2/22
+    assert rapidfuzz_similarity([], []) == 1.0
+    assert rapidfuzz_similarity(["a"], []) == 0.0  # Length mismatch
+
+
+def test_line_similarity():
+    assert line_similarity(["hello"], ["hello"]) == 1.0
+    assert line_similarity(["kitten"], ["sitting"]) == pytest.approx(0.571, abs=0.001)  # (7-3)/7
+    assert line_similarity(["line1", "line2"], ["line1", "line3"]) == pytest.approx(0.9, abs=0.001)  # 1 over 5+5
+    assert line_similarity([], []) == 1.0
+    assert line_similarity(["a"], []) == 0.0  # Length mismatch
+    assert line_similarity(["", ""], ["", ""]) == 1.0
+
+
+def test_levenshtein_similarity_score_cutoff():
+    assert levenshtein_similarity(["kitten"], ["sitting"], score_cutoff=0.9) == 0.0  # 0.571 is below the cutoff
+    assert levenshtein_similarity(["kitten"], ["sitting"], score_cutoff=0.5) == pytest.approx(0.571, abs=0.001)
+    assert levenshtein_similarity(["abcdefghij"], ["abcdefghiX"], score_cutoff=0.9) == pytest.approx(0.9)  # At cutoff
+    assert levenshtein_similarity(["hello"], ["hello"], score_cutoff=1.0) == 1.0
+    assert levenshtein_similarity([], [], score_cutoff=0.9) == 1.0
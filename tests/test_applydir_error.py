@@ -1,5 +1,7 @@
 import pytest
 import logging
+import subprocess
+import sys
 from pathlib import Path
 from prepdir import configure_logging
 from applydir.applydir_error import ApplydirError, ErrorType, ErrorSeverity
@@ -304,3 +306,19 @@ def test_whitespace_message_raises():
         )
     assert "Message cannot be empty or whitespace-only" in str(exc_info.value)
     logger.debug(f"Whitespace message error: {exc_info.value}")
+
+
+@pytest.mark.parametrize(
+    "import_line", ["from applydir import ApplydirError", "from applydir.applydir_error import ApplydirError"]
+)
+def test_error_deserializes_in_fresh_process(import_line):
+    """Test ApplydirError is fully defined on import, before any error instance has been built."""
+    script = (
+        f"{import_line}\n"
+        "error = ApplydirError.model_validate_json('{\"error_type\": \"file_path\", \"message\": \"Bad path\"}')\n"
+        "assert error.change is None and error.error_type == 'file_path'\n"
+        "ApplydirError.model_validate({'error_type': 'file_path', 'message': 'Bad path'})\n"
+        "ApplydirError.model_json_schema()\n"
+    )
+    completed = subprocess.run([sys.executable, "-c", script], capture_output=True, text=True)
+    assert completed.returncode == 0, completed.stderr
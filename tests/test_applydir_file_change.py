@@ -553,3 +553,27 @@ def test_get_non_ascii_severity_extension_rule():
     severity = get_non_ascii_severity(TEST_ASCII_CONFIG, "extensions", ".py")
     assert severity == "error"
     logger.debug("get_non_ascii_severity for .py: error")
+
+
+def test_validate_change_severity_cache(monkeypatch):
+    """Test a shared severity_cache resolves each non-ASCII rule from config only once."""
+    import applydir.applydir_file_change as file_change_module
+
+    calls = []
+
+    def counting_severity(config, rule_name, file_extension=None):
+        calls.append((rule_name, file_extension))
+        return get_non_ascii_severity(config, rule_name, file_extension=file_extension)
+
+    monkeypatch.setattr(file_change_module, "get_non_ascii_severity", counting_severity)
+    severity_cache = {}
+    for line in ["print('café')", "x = 1"]:
+        change = ApplydirFileChange(
+            file_path=Path("src/main.py"),
+            original_lines=[],
+            changed_lines=[line],
+            action=ActionType.CREATE_FILE,
+        )
+        change.validate_change(TEST_ASCII_CONFIG, severity_cache)
+    assert calls == [("path", None), ("extensions", ".py")]
+    assert severity_cache == {("path",): "error", ("extensions", ".py"): "error"}
@@ -2,7 +2,7 @@ import pytest
 import logging
 from pathlib import Path
 from prepdir import configure_logging
-from applydir.applydir_matcher import ApplydirMatcher
+from applydir.applydir_matcher import ApplydirMatcher, _file_extension
 from applydir.applydir_file_change import ApplydirFileChange, ActionType
 from applydir.applydir_error import ApplydirError, ErrorType, ErrorSeverity
 
@@ -502,3 +502,58 @@ def test_get_similarity_threshold_multiple_rules():
     result = matcher.get_similarity_threshold("src/main.py")
     assert result == 0.8
     logger.debug(f"Multiple rules similarity threshold: {result}")
+
+
+def test_match_fuzzy_rapidfuzz_ratio():
+    """Test fuzzy match using the rapidfuzz_ratio metric."""
+    change = ApplydirFileChange(
+        file_path="src/main.py",
+        original_lines=["print('hello')"],
+        changed_lines=["print('Hello World')"],
+        action=ActionType.REPLACE_LINES,
+    )
+    file_lines = ["print('helo')", "x = 1"]  # Typo
+    matcher = ApplydirMatcher(
+        config={
+            "matching": {
+                "similarity": {"default": 0.9},
+                "similarity_metric": {"default": "rapidfuzz_ratio"},
+                "use_fuzzy": {"default": True},
+            }
+        },
+    )
+    result, errors = matcher.match(file_lines, change)
+    assert result == {"start": 0, "end": 1}
+    assert len(errors) == 0
+
+
+def test_match_fuzzy_line_levenshtein():
+    """Test fuzzy match using the line_levenshtein metric across a multi-line window."""
+    change = ApplydirFileChange(
+        file_path="src/main.py",
+        original_lines=["x = 1", "print('hello')"],
+        changed_lines=["x = 1", "print('Hello World')"],
+        action=ActionType.REPLACE_LINES,
+    )
+    file_lines = ["x = 1", "print('helo')", "y = 2"]  # Typo; 1 edit over 5 + 14 characters
+    matcher = ApplydirMatcher(
+        config={
+            "matching": {
+                "similarity": {"default": 0.9},
+                "similarity_metric": {"default": "line_levenshtein"},
+                "use_fuzzy": {"default": True},
+            }
+        },
+    )
+    result, errors = matcher.match(file_lines, change)
+    assert result == {"start": 0, "end": 2}
+    assert len(errors) == 0
+
+
+@pytest.mark.parametrize(
+    "name", ["src/main.py", "README.MD", "foo.", "src/foo.", ".bashrc", "archive.tar.gz", "Makefile"]
+)
+def test_file_extension_matches_path_suffix(name):
+    """Test _file_extension agrees with Path.suffix, including names that end in a dot."""
+    assert _file_extension(name) == Path(name).suffix.lower()
+    assert _file_extension(Path(name)) == Path(name).suffix.lower()
@@ -1,6 +1,7 @@
 # tests/test_main.py
 import json
 import logging
+import subprocess
 import sys
 from pathlib import Path
 from typing import Dict, Optional
@@ -322,4 +323,26 @@ def test_main_empty_file_entries(tmp_path: Path, caplog):
     log_text = caplog.text
     assert "Invalid JSON structure" in log_text
     assert "file_entries" in log_text
-    assert "non-empty array" in log_text
\ No newline at end of file
+    assert "non-empty array" in log_text
+
+
+def test_package_main_is_function_after_submodule_import():
+    """Test applydir.main stays the CLI function once the applydir.main submodule has been imported."""
+    import applydir
+    import applydir.main
+    from applydir import main as package_main
+
+    assert applydir.main is main
+    assert package_main is main
+
+
+def test_import_applydir_defers_heavy_dependencies():
+    """Test importing the package (and with it the CLI entry point) loads none of the heavy dependencies."""
+    script = (
+        "import sys\n"
+        "import applydir\n"
+        "loaded = [name for name in ('pydantic', 'prepdir', 'dynaconf', 'rapidfuzz') if name in sys.modules]\n"
+        "assert not loaded, loaded\n"
+    )
+    completed = subprocess.run([sys.executable, "-c", script], capture_output=True, text=True)
+    assert completed.returncode == 0, completed.stderr